@@ -0,0 +1,38 @@
+"""Timing helpers shared by the benchmark workloads."""
+
+import sys
+import time
+
+GOVERNOR_PATH = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor"
+
+
+def best_of_ns(fn, warmup=3, repeats=5):
+    """Run ``fn`` ``warmup`` times untimed, then return the fastest of ``repeats`` runs in ns."""
+    for _ in range(warmup):
+        fn()
+    best = None
+    for _ in range(repeats):
+        t0 = time.perf_counter_ns()
+        fn()
+        dt = time.perf_counter_ns() - t0
+        best = dt if best is None else min(best, dt)
+    return best
+
+
+def warn_unless_performance_governor():
+    """Print a warning when the CPU frequency governor may skew timings."""
+    try:
+        with open(GOVERNOR_PATH) as f:
+            governor = f.read().strip()
+    except OSError:
+        print(
+            "[warn] CPU frequency governor unknown; timings may vary", file=sys.stderr
+        )
+        return
+    if governor != "performance":
+        print(
+            f"[warn] CPU governor is '{governor}', not 'performance'; "
+            "turbo/throttle transients may skew timings "
+            "(cpupower frequency-set -g performance)",
+            file=sys.stderr,
+        )
@@ -0,0 +1,20 @@
+"""Compiled kernels for the cache hierarchy test."""
+
+import numba
+
+
+@numba.njit(cache=True, boundscheck=False)
+def strided_inc(a, stride, reps):
+    """Increment every ``stride``-th element of ``a`` ``reps`` times."""
+    for _ in range(reps):
+        for i in range(0, a.shape[0], stride):
+            a[i] += 1.0
+
+
+@numba.njit(cache=True, boundscheck=False, parallel=True)
+def strided_inc_par(a, stride, reps):
+    """Parallel ``strided_inc``: the touched elements are split across threads."""
+    count = (a.shape[0] + stride - 1) // stride
+    for _ in range(reps):
+        for k in numba.prange(count):
+            a[k * stride] += 1.0
@@ -1,19 +1,52 @@
 #!/usr/bin/env python3
 # 2. Cache Hierarchy Test
-import time
+import os
 
+import numba
 import numpy as np
 
+from benchwrap.benchmarks._timing import best_of_ns
+from benchwrap.benchmarks.cache_test._kernel import (strided_inc,
+                                                     strided_inc_par)
+
+warmup = int(os.getenv("CACHE_TEST_WARMUP", "3"))
+repeats = int(os.getenv("CACHE_TEST_REPEATS", "5"))
+thread_counts = [
+    t
+    for t in (
+        int(v)
+        for v in os.getenv("CACHE_TEST_THREADS", "1,2,4,8").split(",")
+        if v.strip()
+    )
+    if 0 < t <= numba.config.NUMBA_NUM_THREADS
+]
+
 sizes = [2**i for i in range(10, 25)]  # 1KB to 32MB
 times = []
 
+# Compile once so JIT time stays out of the measurements
+strided_inc(np.zeros(8), 4, 1)
+strided_inc_par(np.zeros(8), 4, 1)
+
 for sz in sizes:
-    a = np.random.rand(sz)
+    a = np.empty(sz, dtype=np.float64)
     # Touch memory to load into cache
-    a.sum()
-    start = time.time()
-    # Strided access to defeat prefetch
-    for _ in range(100):
-        a[::4] += 1  # 16-byte stride on 64-bit systems
-    times.append((sz, time.time() - start))
+    a.fill(1.0)
+    # Strided access to defeat prefetch: 32-byte stride on 64-bit floats
+    duration = best_of_ns(lambda a=a: strided_inc(a, 4, 100), warmup, repeats) / 1e9
+    times.append((sz, duration))
 print("Cache test complete:", times[-3:])  # Show large-size results
+
+# Same sweep spread over several cores: per-core caches add up, shared L3
+# and DRAM do not, so the scaling shows where the memory wall sits.
+for threads in thread_counts:
+    numba.set_num_threads(threads)
+    par_times = []
+    for sz in sizes:
+        a = np.empty(sz, dtype=np.float64)
+        a.fill(1.0)
+        duration = (
+            best_of_ns(lambda a=a: strided_inc_par(a, 4, 100), warmup, repeats) / 1e9
+        )
+        par_times.append((sz, duration))
+    print(f"Cache test {threads} threads:", par_times[-3:])
@@ -8,8 +8,16 @@ module load likwid
 source activate energy
 DEST="$HOME/.local/share/benchwrap/jobs/flops_matrix_mul/job_${SLURM_JOB_ID}"
 
+# Count the FLOPs of the precision the workload actually runs
+export GEMM_DTYPE="${GEMM_DTYPE:-f64}"
+if [ "$GEMM_DTYPE" = "f32" ]; then
+  LIKWID_GROUP=FLOPS_SP
+else
+  LIKWID_GROUP=FLOPS_DP
+fi
+
 srun --cpu-bind=cores \
-  likwid-perfctr -g FLOPS_DP -t 1s \
+  likwid-perfctr -g "$LIKWID_GROUP" -t 1s \
   python3 -u -m benchwrap.benchmarks.flops_matrix_mul.workload 1>&2
 
 
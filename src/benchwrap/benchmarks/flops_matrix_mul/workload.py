@@ -2,23 +2,49 @@
 import os
 import time
 
-import numpy as np
-import psutil
+# BLAS reads its thread count at import time; default to the CPUs srun bound us to
+_threads = str(len(os.sched_getaffinity(0)))
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, _threads)
+# Keep OpenMP threads on their cores so migrations do not show up in the timing
+os.environ.setdefault("OMP_PROC_BIND", "close")
+os.environ.setdefault("OMP_PLACES", "cores")
+
+# The thread/binding variables above must be set before BLAS loads, hence E402
+import numpy as np  # noqa: E402
+import psutil  # noqa: E402
+
+from benchwrap.benchmarks import _timing  # noqa: E402
+
+DTYPES = {"f64": np.float64, "f32": np.float32}
+dtype_name = os.getenv("GEMM_DTYPE", "f64")
+if dtype_name not in DTYPES:
+    raise SystemExit(
+        f"GEMM_DTYPE must be one of {', '.join(DTYPES)}, got {dtype_name!r}"
+    )
+dtype = np.dtype(DTYPES[dtype_name])
 
 n = 30_000
-gb = 2 * n * n * 8 / 1e9
-print(f"Allocating two {n}x{n} matrices ≈{gb:.1f} GB", flush=True)
-
-
-a = np.random.random((n, n))
-b = np.random.random((n, n))
-print(f"Multiplying on {os.cpu_count()} logical cores …", flush=True)
-
+# Each GEMM at this size runs for tens of seconds, so fewer rounds than the cheap kernels
+warmup = int(os.getenv("GEMM_WARMUP", "1"))
+repeats = int(os.getenv("GEMM_REPEATS", "3"))
+gb = 2 * n * n * dtype.itemsize / 1e9
+print(f"Allocating two {n}x{n} {dtype_name} matrices ≈{gb:.1f} GB", flush=True)
+
+
+# Generate directly in the target dtype: no float64 temporary, no extra copy
+rng = np.random.default_rng()
+a = rng.random((n, n), dtype=dtype)
+b = rng.random((n, n), dtype=dtype)
+c = np.empty((n, n), dtype=dtype)
+c.fill(0)  # first-touch the output pages before timing
+print(f"Multiplying on {_threads} cores …", flush=True)
+
+_timing.warn_unless_performance_governor()
 start_time = time.time()
 
-t0 = time.time()
-c = a @ b  # heavy lift: BLAS dgemm
-dt = time.time() - t0
+# heavy lift: BLAS dgemm/sgemm, best of `repeats` after `warmup` untimed runs
+dt = _timing.best_of_ns(lambda: np.matmul(a, b, out=c), warmup, repeats) / 1e9
 print(
     f"GEMM done in {dt:.2f} s → {8*n**3/dt/1e9:.2f} GFLOP/s in time: {time.time() -start_time}",
     flush=True,
@@ -1,8 +1,5 @@
 #!/usr/bin/env python3
-import os
-import time
-
-import numpy as np
+import pathlib
 
 # Define variables of the ini files
 # [global]
@@ -11,22 +8,17 @@ import numpy as np
 # blockSize = 64m
 # repetitions = 1
 
-transferSizes = [str(2**x) + "m" for x in range(1, 10)]
-blocksize = [str(2**x) + "m" for x in range(4, 16)]
-print(transferSizes)
-print(blocksize)
+transferSizes = [2**x for x in range(1, 10)]  # MiB
+blocksize = [2**x for x in range(4, 16)]  # MiB
+print([f"{ts}m" for ts in transferSizes])
+print([f"{bs}m" for bs in blocksize])
 
-combinations = []
-for ts in transferSizes:
-    for bs in blocksize:
-        if bs > ts:
-            combinations.append((ts, bs))
+# Compare sizes numerically; as strings "16m" < "2m"
+combinations = [(ts, bs) for ts in transferSizes for bs in blocksize if bs > ts]
 
-os.mkdir(f"ior_inis")
-os.chdir(f"ior_inis")
+outdir = pathlib.Path("ior_inis")
+outdir.mkdir()
 for ts, bs in combinations:
-
-    with open(f"ior_ts_{ts}_bs_{bs}.ini", "w") as f:
-        f.write(
-            f"[global]\napi = POSIX \ntransferSize = {ts}\nblockSize = {bs}\nrepetitions = 10"
-        )
+    (outdir / f"ior_ts_{ts}m_bs_{bs}m.ini").write_text(
+        f"[global]\napi = POSIX \ntransferSize = {ts}m\nblockSize = {bs}m\nrepetitions = 10"
+    )
@@ -1,19 +1,44 @@
 #!/usr/bin/env python3
 # 1. Memory Bandwidth Test (AXPY variant)
-import time
+import os
 
 import numpy as np
 
-n = 2**28  # ~268 million elements (2GB array)
+from benchwrap.benchmarks._timing import (best_of_ns,
+                                          warn_unless_performance_governor)
+from benchwrap.benchmarks.mem_bandwidth._kernel import axpy_multistream
+
+n = int(os.getenv("MEM_BW_SIZE", str(2**28)))  # ~268 million elements (2GB array)
+stream_counts = [
+    int(s) for s in os.getenv("MEM_BW_STREAMS", "1,2,4,8,16").split(",") if s.strip()
+]
+warmup = int(os.getenv("MEM_BW_WARMUP", "3"))
+repeats = int(os.getenv("MEM_BW_REPEATS", "5"))
 x = np.random.rand(n)
 y = np.random.rand(n)
+out = np.empty_like(x)
 alpha = 2.0
 
-# Cache warming
-np.add(alpha * x, y)
 
-start = time.time()
-np.add(alpha * x, y)  # 2n reads + n writes
-duration = time.time() - start
-gb = (3 * 8 * n) / 1e9  # GB moved
+def axpy():
+    # In-place pipeline: no temporary for alpha * x
+    np.multiply(x, alpha, out=out)  # n reads + n writes
+    np.add(out, y, out=out)  # 2n reads + n writes
+
+
+warn_unless_performance_governor()
+duration = best_of_ns(axpy, warmup, repeats) / 1e9
+gb = (5 * 8 * n) / 1e9  # GB moved: 3n reads + 2n writes
 print(f"Memory BW: {gb/duration:.2f} GB/s")
+
+# Multi-striding: one pass (2n reads + n writes) split into k concurrent streams
+axpy_multistream(alpha, x[:64], y[:64], out[:64], 1)  # compile outside timing
+gb = (3 * 8 * n) / 1e9
+for streams in stream_counts:
+    duration = (
+        best_of_ns(
+            lambda s=streams: axpy_multistream(alpha, x, y, out, s), warmup, repeats
+        )
+        / 1e9
+    )
+    print(f"Memory BW ({streams} streams): {gb/duration:.2f} GB/s")
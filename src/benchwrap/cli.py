@@ -8,24 +8,135 @@ most commonly used helpers so external tooling and tests can keep importing from
 
 from __future__ import annotations
 
-import importlib.resources as res
-import subprocess
+import importlib
+from typing import TYPE_CHECKING
 
 import click
 
-from .cli_auth import (active_username, ensure_data_dir, get_access_token,
-                       login, logout, register, registered)
 from .cli_benchmarks import (add_impl_command, describe_impl, list_impl,
                              run_impl)
 from .cli_constants import (BASE_URL, BENCH_PKG, BENCH_ROOT, DATA_DIR,
                             EXECUTORS_PKG, TOK_FILE, USER_ROOT)
-from .cli_progress import (PRINT_LOCK, ProgressFile, inline_progress_line,
-                           pac_line, safe_print, table_start, table_update)
-from .cli_sync import (_human_readable_size, list_files_upload, sync,
-                       upload_many, upload_one)
 
+if TYPE_CHECKING:
+    # Static view of the lazy re-exports below, for type checkers and linters
+    import importlib.resources as res
+    import subprocess
+
+    from .cli_auth import (active_username, ensure_data_dir, get_access_token,
+                           login, logout, register, registered)
+    from .cli_progress import PRINT_LOCK, ProgressFile
+    from .cli_progress import inline_progress_line as _progress_line
+    from .cli_progress import (pac_line, safe_print, table_start, table_stop,
+                               table_update)
+    from .cli_sync import (_human_readable_size, list_files_upload, sync,
+                           upload_many, upload_one)
+
+# Re-exported names resolved on first access, so ``benchwrap --help`` and the
+# benchmark commands do not import the HTTP stack, subprocess or importlib.resources
+_LAZY_MODULES = {"res": "importlib.resources", "subprocess": "subprocess"}
+_LAZY_EXPORTS = {
+    "active_username": ("cli_auth", "active_username"),
+    "ensure_data_dir": ("cli_auth", "ensure_data_dir"),
+    "get_access_token": ("cli_auth", "get_access_token"),
+    "login": ("cli_auth", "login"),
+    "logout": ("cli_auth", "logout"),
+    "register": ("cli_auth", "register"),
+    "registered": ("cli_auth", "registered"),
+    "PRINT_LOCK": ("cli_progress", "PRINT_LOCK"),
+    "ProgressFile": ("cli_progress", "ProgressFile"),
+    "inline_progress_line": ("cli_progress", "inline_progress_line"),
+    "_progress_line": ("cli_progress", "inline_progress_line"),
+    "pac_line": ("cli_progress", "pac_line"),
+    "safe_print": ("cli_progress", "safe_print"),
+    "table_start": ("cli_progress", "table_start"),
+    "table_stop": ("cli_progress", "table_stop"),
+    "table_update": ("cli_progress", "table_update"),
+    "_human_readable_size": ("cli_sync", "_human_readable_size"),
+    "list_files_upload": ("cli_sync", "list_files_upload"),
+    "sync": ("cli_sync", "sync"),
+    "upload_many": ("cli_sync", "upload_many"),
+    "upload_one": ("cli_sync", "upload_one"),
+}
+
+
+def __getattr__(name: str):
+    """Resolve re-exported helpers lazily (PEP 562).
+
+    Input: attribute name looked up on ``benchwrap.cli``.
+    Output: the helper from its defining module; raises ``AttributeError`` otherwise.
+    """
+    if name in _LAZY_MODULES:
+        return importlib.import_module(_LAZY_MODULES[name])
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(f".{module_name}", __package__), attr)
+
+
+class LazyGroup(click.Group):
+    """Click group that imports some subcommands only when they are looked up.
+
+    Input: ``lazy_subcommands`` mapping command names to ``(module, attribute)``,
+    and ``lazy_help`` with their one-line summaries for the help listing.
+    Output: behaves like ``click.Group``; ``benchwrap run``/``list`` and
+    ``benchwrap --help`` never import the HTTP upload stack.
+    """
 
-@click.group()
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: dict[str, tuple[str, str]] | None = None,
+        lazy_help: dict[str, str] | None = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self.lazy_help = lazy_help or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name]
+            return getattr(importlib.import_module(module_name), attr)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        # Same layout as click.Group, but lazy commands with a known summary are
+        # listed through a stub so ``--help`` does not import their modules
+        commands = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_help:
+                cmd = click.Command(name, help=self.lazy_help[name])
+            else:
+                cmd = self.get_command(ctx, name)
+            if cmd is None or cmd.hidden:
+                continue
+            commands.append((name, cmd))
+
+        if commands:
+            limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+            rows = [(name, cmd.get_short_help_str(limit)) for name, cmd in commands]
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "sync": ("benchwrap.cli_sync", "sync"),
+        "logout": ("benchwrap.cli_auth", "logout"),
+    },
+    lazy_help={
+        "sync": "Synchronize user benchmarks with remote storage.",
+        "logout": "Clear the active account credentials without deleting sync history.",
+    },
+)
 def benchwrap():
     """Energy-aware benchmark helper.
 
@@ -85,7 +196,6 @@ def run(name, partition, nodes, opt_partition, opt_nodes, exclusive):
         opt_nodes,
         exclusive,
         user_root=USER_ROOT,
-        subprocess_module=subprocess,
     )
 
 
@@ -100,12 +210,8 @@ def add(source):
     add_impl_command(source, user_root=USER_ROOT)
 
 
-benchwrap.add_command(sync)
-benchwrap.add_command(logout)
-
 # Backwards compatibility aliases -------------------------------------------------
 BASE = BASE_URL
-_progress_line = inline_progress_line
 
 __all__ = [
     "BASE",
@@ -139,6 +245,7 @@ __all__ = [
     "pac_line",
     "table_start",
     "table_update",
+    "table_stop",
     "safe_print",
     "_human_readable_size",
     "_progress_line",
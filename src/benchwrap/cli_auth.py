@@ -3,13 +3,37 @@
 from __future__ import annotations
 
 import base64
+import functools
 import json
+import os
+import time
 
 import click
-import requests
 
 from .cli_constants import BASE_URL, DATA_DIR, TOK_FILE
 
+ACCESS_TOKEN_MARGIN = 300  # seconds of validity a cached access token must still have
+
+# Parsed TOK_FILE contents keyed on (path, st_mtime_ns, st_size); written through
+# by _write_token_state so a sync run reads the file at most once
+_token_cache: dict[str, object] = {"key": None, "state": {}}
+
+
+@functools.lru_cache(maxsize=1)
+def api_session():
+    """Return the process-wide session for requests to the Benchwrap API.
+
+    Input: none.
+    Output: ``requests.Session`` whose pooled connection to ``BASE_URL`` stays
+    alive across refresh, login and the sync reachability probe.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount(BASE_URL, HTTPAdapter(pool_connections=1, pool_maxsize=2))
+    return session
+
 
 def ensure_data_dir() -> None:
     """Create the data directory and token file if needed.
@@ -18,8 +42,10 @@ def ensure_data_dir() -> None:
     Output: ensures ``DATA_DIR`` exists and ``TOK_FILE`` is present with 0600 perms.
     """
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    if not TOK_FILE.exists():
-        TOK_FILE.touch(mode=0o600)
+    try:
+        TOK_FILE.touch(mode=0o600, exist_ok=False)
+    except FileExistsError:
+        pass  # keep mtime untouched so the cached token state stays valid
 
 
 def _decode_access_payload(access_token: str) -> dict[str, str]:
@@ -34,11 +60,18 @@ def _decode_access_payload(access_token: str) -> dict[str, str]:
     return decoded if isinstance(decoded, dict) else {}
 
 
-def _read_token_state() -> dict[str, str]:
-    """Read token state, accepting the legacy plain-refresh-token format."""
-    if not TOK_FILE.exists():
-        return {}
-    raw = TOK_FILE.read_text().strip()
+def _token_file_key() -> tuple[str, int, int] | None:
+    """Return the cache key for ``TOK_FILE``, or ``None`` when it does not exist."""
+    try:
+        st = os.stat(TOK_FILE)
+    except FileNotFoundError:
+        return None
+    return os.fspath(TOK_FILE), st.st_mtime_ns, st.st_size
+
+
+def _parse_token_state(raw: str) -> dict[str, str]:
+    """Parse token file text, accepting the legacy plain-refresh-token format."""
+    raw = raw.strip()
     if not raw:
         return {}
     try:
@@ -48,13 +81,54 @@ def _read_token_state() -> dict[str, str]:
     return data if isinstance(data, dict) else {}
 
 
-def _write_token_state(*, refresh: str, username: str | None = None) -> None:
-    """Persist the active account credentials."""
-    ensure_data_dir()
+def _read_token_state() -> dict[str, str]:
+    """Read token state, reusing the parsed copy while the file is unchanged."""
+    key = _token_file_key()
+    if key is None:
+        return {}
+    if _token_cache["key"] != key:
+        _token_cache.update(key=key, state=_parse_token_state(TOK_FILE.read_text()))
+    return dict(_token_cache["state"])
+
+
+def _write_token_file(data: bytes, state: dict[str, str]) -> None:
+    """Replace ``TOK_FILE`` contents through a 0600 descriptor.
+
+    Input: encoded file contents and the state they represent.
+    Output: writes the file (tightening older, wider permissions) and primes
+    ``_token_cache`` with ``state``; returns ``None``.
+    """
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    fd = os.open(TOK_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.fchmod(fd, 0o600)
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    _token_cache.update(key=_token_file_key(), state=state)
+
+
+def _write_token_state(
+    *, refresh: str, username: str | None = None, access: str | None = None
+) -> None:
+    """Persist the active account credentials, including the current access token."""
     state = {"refresh": refresh}
     if username:
         state["username"] = username
-    TOK_FILE.write_text(json.dumps(state, sort_keys=True))
+    if access:
+        state["access"] = access
+    _write_token_file(json.dumps(state, sort_keys=True).encode("utf-8"), state)
+
+
+def _cached_access_token(token_state: dict[str, str]) -> str | None:
+    """Return the stored access token while its JWT ``exp`` is far enough away."""
+    access = token_state.get("access")
+    if not access:
+        return None
+    expires = _decode_access_payload(access).get("exp")
+    if not isinstance(expires, (int, float)):
+        return None
+    return access if expires - time.time() > ACCESS_TOKEN_MARGIN else None
 
 
 def active_username() -> str | None:
@@ -77,7 +151,7 @@ def register() -> str | bool:
         click.echo("Passwords do not match!")
         return False
 
-    response = requests.post(
+    response = api_session().post(
         f"{BASE_URL}/auth/register",
         json={"username": username, "password": password},
         timeout=(10, 30),
@@ -87,7 +161,9 @@ def register() -> str | bool:
         return False
 
     data = response.json()
-    _write_token_state(refresh=data["refresh"], username=username)
+    _write_token_state(
+        refresh=data["refresh"], username=username, access=data["access"]
+    )
     click.echo("✔ Registration successful.")
     return data["access"]
 
@@ -102,18 +178,23 @@ def registered() -> bool:
 
 
 def get_access_token() -> str | bool:
-    """Exchange the stored refresh token for a fresh access token.
+    """Return a usable access token, refreshing it only when needed.
 
     Input: relies on ``TOK_FILE`` containing a refresh token string.
-    Output: new access token string or ``False`` if refresh fails.
+    Output: the stored access token while it has more than
+    ``ACCESS_TOKEN_MARGIN`` seconds left, otherwise a freshly exchanged one;
+    ``False`` if refresh fails.
     """
-    if not TOK_FILE.exists():
+    token_state = _read_token_state()
+    if not token_state.get("refresh"):
         click.echo("No registration found. Please register first.")
         return False
 
-    token_state = _read_token_state()
+    cached = _cached_access_token(token_state)
+    if cached:
+        return cached
     refresh_id = token_state.get("refresh", "")
-    response = requests.post(
+    response = api_session().post(
         f"{BASE_URL}/auth/refresh",
         params={"rid": refresh_id},
         timeout=(10, 30),
@@ -125,7 +206,9 @@ def get_access_token() -> str | bool:
     data = response.json()
     payload = _decode_access_payload(data.get("access", ""))
     username = token_state.get("username") or payload.get("username")
-    _write_token_state(refresh=data["refresh"], username=username)
+    _write_token_state(
+        refresh=data["refresh"], username=username, access=data["access"]
+    )
     return data["access"]
 
 
@@ -139,7 +222,7 @@ def login() -> str | bool:
 
     username = click.prompt("Username", type=str)
     password = click.prompt("Password", hide_input=True)
-    response = requests.post(
+    response = api_session().post(
         f"{BASE_URL}/auth/password",
         params={"u": username, "p": password},
         timeout=(10, 30),
@@ -149,7 +232,9 @@ def login() -> str | bool:
         return False
 
     data = response.json()
-    _write_token_state(refresh=data["refresh"], username=username)
+    _write_token_state(
+        refresh=data["refresh"], username=username, access=data["access"]
+    )
     click.echo("✔ Login successful.")
     return data["access"]
 
@@ -157,7 +242,5 @@ def login() -> str | bool:
 @click.command()
 def logout() -> None:
     """Clear the active account credentials without deleting sync history."""
-    ensure_data_dir()
-    if TOK_FILE.exists():
-        TOK_FILE.write_text("")
+    _write_token_file(b"", {})
     click.echo("✔ Logged out.")
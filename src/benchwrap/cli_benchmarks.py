@@ -2,37 +2,164 @@
 
 from __future__ import annotations
 
-import importlib.resources as res
+import bisect
+import functools
+import itertools
 import os
 import pathlib
-import subprocess
+import runpy
 import sys
 
 import click
 
-from benchwrap.core import add_impl
+from .cli_constants import EXECUTORS_PKG, USER_ROOT, USER_ROOT_STR
 
-from .cli_constants import EXECUTORS_PKG, USER_ROOT
+
+@functools.lru_cache(maxsize=8)
+def _scan_user_root(
+    root: str, mtime_ns: int
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Scan ``root`` once per directory modification time.
+
+    Input: user benchmark root and its ``st_mtime_ns`` (part of the cache key, so
+    adding or removing entries invalidates the cached listing).
+    Output: tuple of (module stems, candidate directory names); whether a
+    directory holds ``job_start.sh`` is checked separately by ``_has_job_start``.
+    """
+    user_py_files: list[str] = []
+    user_directories: list[str] = []
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return (), ()
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith((".", "_")):
+                continue  # hidden entries, __pycache__, private helper modules
+            if entry.is_file() and name.endswith(".py"):
+                user_py_files.append(name[:-3])
+            elif entry.is_dir():
+                user_directories.append(name)
+    return tuple(user_py_files), tuple(user_directories)
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_job_start(path: str, mtime_ns: int) -> bool:
+    """Check for ``job_start.sh`` once per (directory, ``st_mtime_ns``) pair."""
+    return os.path.exists(os.path.join(path, "job_start.sh"))
+
+
+def _has_job_start(path: str) -> bool:
+    """Report whether the benchmark directory ``path`` contains ``job_start.sh``.
+
+    Input: directory path.
+    Output: ``True`` when the launcher exists; keyed on the directory's own
+    mtime, so adding or removing the script invalidates the cached answer even
+    though the user root's mtime is unchanged.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return False
+    return _probe_job_start(path, mtime_ns)
 
 
 def _iter_user_content(
-    user_root: pathlib.Path | None = None,
+    user_root: pathlib.Path | str | None = None,
 ) -> tuple[list[str], list[str]]:
     """Discover user-provided benchmarks under ``user_root``.
 
     Input: optional override for the benchmark root directory.
     Output: tuple of (list of module stems, list of directory names) found beneath the root.
     """
-    root = pathlib.Path(user_root) if user_root is not None else USER_ROOT
-    user_py_files: list[str] = []
-    user_directories: list[str] = []
-    if os.path.isdir(root):
-        for path in pathlib.Path(root).iterdir():
-            if path.is_file() and path.suffix == ".py" and path.stem != "__init__":
-                user_py_files.append(path.stem)
-            elif path.is_dir() and (path / "job_start.sh").exists():
-                user_directories.append(path.name)
-    return user_py_files, user_directories
+    root = os.fspath(user_root) if user_root is not None else USER_ROOT_STR
+    try:
+        mtime_ns = os.stat(root).st_mtime_ns
+    except OSError:
+        return [], []
+    user_py_files, candidates = _scan_user_root(root, mtime_ns)
+    user_directories = [
+        name for name in candidates if _has_job_start(os.path.join(root, name))
+    ]
+    return list(user_py_files), user_directories
+
+
+@functools.lru_cache(maxsize=8)
+def _pkg_modules(root) -> tuple[str, ...]:
+    """List built-in executor modules, scanning each package root only once.
+
+    Input: traversable for the executors package.
+    Output: tuple of module stems, excluding ``__init__``.
+    """
+    if isinstance(root, pathlib.Path):
+        # Regular on-disk install: plain names from scandir, no Path per entry
+        with os.scandir(root) as entries:
+            names = [entry.name for entry in entries]
+    else:
+        names = [p.name for p in root.iterdir()]
+    return tuple(
+        name[:-3] for name in names if name.endswith(".py") and name != "__init__.py"
+    )
+
+
+def _discover_benchmarks(
+    user_root: pathlib.Path | str | None = None,
+) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """Collect built-in and user benchmark names in a single pass.
+
+    Input: optional user benchmark directory override.
+    Output: tuple of (built-in executor modules, user module stems, user directory names).
+    """
+    # Deferred so commands that never discover benchmarks skip the import
+    import importlib.resources as res
+
+    user_py_files, user_directories = _iter_user_content(user_root)
+    return (
+        _pkg_modules(res.files(EXECUTORS_PKG)),
+        tuple(user_py_files),
+        tuple(user_directories),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _benchmark_index(
+    pkg_modules: tuple[str, ...],
+    user_py_files: tuple[str, ...],
+    user_directories: tuple[str, ...],
+) -> tuple[dict[str, str], tuple[str, ...]]:
+    """Map every benchmark name to its kind (``pkg``, ``py`` or ``dir``).
+
+    Input: discovered built-in modules, user module stems, and user directories.
+    Output: tuple of (name-to-kind dictionary, sorted names for prefix search);
+    built-ins win over user entries of the same name. Callers must not mutate
+    the cached dictionary.
+    """
+    kinds = dict.fromkeys(user_directories, "dir")
+    kinds.update(dict.fromkeys(user_py_files, "py"))
+    kinds.update(dict.fromkeys(pkg_modules, "pkg"))
+    return kinds, tuple(sorted(kinds))
+
+
+def _resolve_choice(
+    choice: str, kinds: dict[str, str], names: tuple[str, ...]
+) -> tuple[str, list[str]]:
+    """Resolve ``choice`` to a benchmark name, allowing unique prefixes.
+
+    Input: user-supplied name, the name-to-kind mapping and its sorted names.
+    Output: tuple of (resolved name, prefix matches considered); exact names
+    skip the prefix search, which otherwise bisects to the first candidate.
+    """
+    if choice in kinds:
+        return choice, [choice]
+    matches = []
+    for name in itertools.islice(names, bisect.bisect_left(names, choice), None):
+        if not name.startswith(choice):
+            break
+        matches.append(name)
+    if len(matches) == 1:
+        return matches[0], matches
+    return choice, matches
 
 
 def list_impl(user_root: pathlib.Path | None = None) -> None:
@@ -41,27 +168,22 @@ def list_impl(user_root: pathlib.Path | None = None) -> None:
     Input: optional user benchmark directory override.
     Output: writes details to stdout; no return value.
     """
-    root = res.files(EXECUTORS_PKG)
-    pkg_modules = [
-        p.stem for p in root.iterdir() if p.suffix == ".py" and p.stem != "__init__"
-    ]
-
-    user_py_files, user_directories = _iter_user_content(user_root)
+    pkg_modules, user_py_files, user_directories = _discover_benchmarks(user_root)
 
     if not pkg_modules and not user_py_files and not user_directories:
         click.echo("No benchmarks found")
         return
 
-    click.echo("== STANDARD MODULES ==")
-    for module in pkg_modules:
-        click.echo(f"  - {module}")
+    # One joined echo: a single write instead of one per benchmark
+    lines = ["== STANDARD MODULES =="]
+    lines.extend(f"  - {module}" for module in pkg_modules)
 
     if user_py_files or user_directories:
-        click.echo("== USER MODULES ==")
-        for module in user_py_files:
-            click.echo(f"  - {module}  (py)")
-        for directory in user_directories:
-            click.echo(f"  - {directory}  (dir)")
+        lines.append("== USER MODULES ==")
+        lines.extend(f"  - {module}  (py)" for module in user_py_files)
+        lines.extend(f"  - {directory}  (dir)" for directory in user_directories)
+
+    click.echo("\n".join(lines))
 
 
 def describe_impl(name: str, user_root: pathlib.Path | None = None) -> None:
@@ -75,24 +197,18 @@ def describe_impl(name: str, user_root: pathlib.Path | None = None) -> None:
         return
 
     user_root_path = pathlib.Path(user_root) if user_root is not None else USER_ROOT
-    root = res.files(EXECUTORS_PKG)
-    pkg_modules = [
-        p.stem for p in root.iterdir() if p.suffix == ".py" and p.stem != "__init__"
-    ]
-    user_py_files, user_directories = _iter_user_content(user_root_path)
-    all_benchmark_names = pkg_modules + user_py_files + user_directories
+    kinds, names = _benchmark_index(*_discover_benchmarks(user_root_path))
+    choice, _ = _resolve_choice(name.strip(), kinds, names)
+    kind = kinds.get(choice)
 
-    choice = name.strip()
-    matches = [n for n in all_benchmark_names if n.startswith(choice)]
-    if len(matches) == 1:
-        choice = matches[0]
+    import importlib.resources as res
 
     description_path = None
-    if choice in pkg_modules:
+    if kind == "pkg":
         description_path = (
             res.files("benchwrap.benchmarks") / choice / "description.txt"
         )
-    elif choice in user_directories:
+    elif kind == "dir":
         description_path = user_root_path / choice / "description.txt"
 
     if description_path is None or not description_path.exists():
@@ -104,6 +220,45 @@ def describe_impl(name: str, user_root: pathlib.Path | None = None) -> None:
     click.echo(text or f"No description found for '{choice}'.")
 
 
+def _run_module(module: str, args: list[str]) -> None:
+    """Run a built-in executor as ``__main__`` inside the current interpreter.
+
+    Input: dotted module name and the arguments its ``argparse`` parser expects.
+    Output: returns ``None``; a non-zero ``SystemExit`` or an exception raised by
+    the executor is reported on stderr, not raised, matching the old subprocess
+    launch where failures stayed in the child and the CLI carried on.
+    """
+    saved_argv = sys.argv
+    sys.argv = [module, *args]
+    try:
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+    except SystemExit as exc:
+        if exc.code not in (None, 0):
+            click.echo(f"[warn] {module} exited with status {exc.code}")
+    except Exception:  # noqa: BLE001 - executor failures must not kill the CLI
+        import traceback
+
+        click.echo(traceback.format_exc(), err=True, nl=False)
+        click.echo(f"[warn] {module} failed", err=True)
+    finally:
+        sys.argv = saved_argv
+
+
+def _launch(command: list[str], subprocess_module=None) -> None:
+    """Hand the terminal over to ``command``.
+
+    Input: argv list and an optional subprocess shim.
+    Output: with a shim, runs ``command`` through it and returns; otherwise
+    ``os.execvp`` replaces the CLI process, since it has nothing left to do.
+    """
+    if subprocess_module is not None:
+        subprocess_module.run(command)
+        return
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvp(command[0], command)
+
+
 def run_impl(
     name,
     partition,
@@ -117,21 +272,17 @@ def run_impl(
     """Execute the selected benchmark with optional SLURM arguments.
 
     Input: benchmark identifiers, SLURM partition/node settings, root override, subprocess shim.
-    Output: runs the appropriate command and returns ``None``.
+    Output: user benchmarks replace the CLI process via ``os.execvp`` (nothing
+    runs after them); with a ``subprocess_module`` shim they are started with
+    its ``run`` and the call returns ``None``.
     """
-    user_root_path = pathlib.Path(user_root) if user_root is not None else USER_ROOT
-    proc = subprocess_module or subprocess
+    # Commands are plain argv strings, so skip pathlib joins on this path
+    user_root_str = os.fspath(user_root) if user_root is not None else USER_ROOT_STR
     effective_partition = opt_partition if opt_partition is not None else partition
     effective_nodes = opt_nodes if opt_nodes is not None else nodes
 
-    root = res.files(EXECUTORS_PKG)
-    pkg_modules = [
-        p.stem for p in root.iterdir() if p.suffix == ".py" and p.stem != "__init__"
-    ]
-    user_py_files, user_directories = _iter_user_content(user_root_path)
-
-    all_benchmark_names = pkg_modules + user_py_files + user_directories
-    if not all_benchmark_names:
+    kinds, names = _benchmark_index(*_discover_benchmarks(user_root_str))
+    if not kinds:
         click.echo("No benchmarks found")
         return
 
@@ -141,11 +292,8 @@ def run_impl(
         )
         return
 
-    choice = name.strip()
-
-    matches = [n for n in all_benchmark_names if n.startswith(choice)]
-    if len(matches) == 1:
-        choice = matches[0]
+    choice, matches = _resolve_choice(name.strip(), kinds, names)
+    kind = kinds.get(choice)
 
     normalized_nodes = None
     if effective_nodes is not None and str(effective_nodes).strip() != "":
@@ -164,25 +312,25 @@ def run_impl(
             command.append("--exclusive")
         return command
 
-    if choice in pkg_modules:
-        click.echo(f"▶ running {EXECUTORS_PKG}.{choice}")
-        command = [sys.executable, "-m", f"{EXECUTORS_PKG}.{choice}"]
-        proc.run(extend_slurm_args(command))
+    if kind == "pkg":
+        module = f"{EXECUTORS_PKG}.{choice}"
+        click.echo(f"▶ running {module}")
+        _run_module(module, extend_slurm_args([]))
 
-    elif choice in user_py_files:
+    elif kind == "py":
         if exclusive:
             click.echo("[warn] --exclusive ignored for user .py benchmarks.")
-        target = pathlib.Path(user_root_path) / f"{choice}.py"
+        target = os.path.join(user_root_str, choice + ".py")
         click.echo(f"▶ running user py {target}")
-        command = [sys.executable, str(target)]
-        proc.run(extend_slurm_args(command))
+        command = [sys.executable, target]
+        _launch(extend_slurm_args(command), subprocess_module)
 
-    elif choice in user_directories:
+    elif kind == "dir":
         if exclusive:
             click.echo("[warn] --exclusive ignored for user directory benchmarks.")
-        script = pathlib.Path(user_root_path) / choice / "job_start.sh"
+        script = os.path.join(user_root_str, choice, "job_start.sh")
         click.echo(f"▶ running {script}")
-        proc.run(["bash", str(script)])
+        _launch(["bash", script], subprocess_module)
     else:
         if matches and len(matches) > 1:
             click.echo("Ambiguous name. Did you mean one of:")
@@ -198,6 +346,9 @@ def add_impl_command(source: str, user_root: pathlib.Path | None = None) -> None
     Input: path to source file/folder and optional target root override.
     Output: echoes success message; returns ``None``.
     """
+    # core pulls in shutil (and with it bz2/lzma); only ``add`` needs it
+    from benchwrap.core import add_impl
+
     target_root = pathlib.Path(user_root) if user_root is not None else USER_ROOT
     src = pathlib.Path(source).resolve()
     dest = add_impl(src, target_root)
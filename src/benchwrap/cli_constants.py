@@ -16,6 +16,7 @@ USER_ROOT = (
     pathlib.Path(os.getenv("XDG_DATA_HOME", pathlib.Path.home() / ".local/share"))
     / "benchwrap/benchmarks"
 )
+USER_ROOT_STR = os.fspath(USER_ROOT)
 JOBS_DEFAULT = DATA_DIR / "jobs"
 SLURM_DEFAULT = pathlib.Path("/opt/misc/profiling/u18101")
 BENCH_ROOT = pathlib.Path(__file__).parent.parent / "src/benchmarks"
@@ -2,25 +2,34 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import mimetypes
 import os
+import pathlib
 import re
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator
 
 import click
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .cli_auth import get_access_token, login, register, registered
+from .cli_auth import (active_username, api_session, get_access_token, login,
+                       register, registered)
 from .cli_constants import (BASE_URL, DATA_DIR, JOBS_DEFAULT, MINIO_TUNNEL_URL,
                             SERVER_URL, SLURM_DEFAULT, TUNNELLING_URL)
-from .cli_progress import (ProgressFile, inline_progress_line, pac_line,
-                           table_start, table_update)
+from .cli_progress import (ProgressFile, inline_progress_line, table_progress,
+                           table_start, table_stop, table_update)
 
 SYNC_STATE_FILE = DATA_DIR / "sync-state.json"
+PRESIGN_BATCH_SIZE = 512
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+PRESIGN_LOOKAHEAD = 2  # per-file presigns kept in flight per upload worker
 
 
 def _slurm_job_id(filename: str) -> str | None:
@@ -70,6 +79,12 @@ def _fast_hash(filepath: str, chunk_size: int = 1024 * 1024) -> str:
     return digest.hexdigest()
 
 
+@functools.lru_cache(maxsize=256)
+def _content_type(suffixes: str) -> str:
+    """Guess a MIME type from a name's suffix chain (e.g. ``.tar.gz``), once per chain."""
+    return mimetypes.guess_type(f"x{suffixes}")[0] or "application/octet-stream"
+
+
 def _load_sync_state() -> dict:
     if not SYNC_STATE_FILE.exists():
         return {"accounts": {}}
@@ -88,12 +103,24 @@ def _save_sync_state(state: dict) -> None:
     SYNC_STATE_FILE.write_text(json.dumps(state, indent=2, sort_keys=True))
 
 
-def _file_signature(filepath: str, benchmark_name: str | None) -> dict[str, object]:
+def _file_signature(
+    filepath: str, benchmark_name: str | None, known: dict | None = None
+) -> dict[str, object]:
     stat = os.stat(filepath)
+    if (
+        known
+        and known.get("hash")
+        and known.get("size") == stat.st_size
+        and known.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        # Same size and mtime as the last upload: trust the stored hash
+        digest = known["hash"]
+    else:
+        digest = _fast_hash(filepath)
     return {
         "size": stat.st_size,
         "mtime_ns": stat.st_mtime_ns,
-        "hash": _fast_hash(filepath),
+        "hash": digest,
         "benchmark_name": benchmark_name,
     }
 
@@ -103,29 +130,43 @@ def _account_key(username: str | None) -> str:
 
 
 def filter_changed_files(
-    files: list[tuple[str, str, str | None]],
+    files: list[tuple[str, str, str | None, int]],
     *,
     username: str | None,
     force: bool = False,
-) -> tuple[list[tuple[str, str, str | None]], dict, dict[str, dict[str, object]]]:
-    """Return files that need uploading and their computed signatures."""
+) -> tuple[list[tuple[str, str, str | None, int]], dict, dict[str, dict[str, object]]]:
+    """Return files that need uploading and their computed signatures.
+
+    Files whose size and mtime match the last upload reuse the stored hash;
+    the rest are hashed on ``HASH_WORKERS`` threads (hashlib releases the GIL).
+    """
     state = _load_sync_state()
     account = state.setdefault("accounts", {}).setdefault(
         _account_key(username), {"files": {}}
     )
     known_files = account.setdefault("files", {})
-    changed: list[tuple[str, str, str | None]] = []
+    changed: list[tuple[str, str, str | None, int]] = []
     signatures: dict[str, dict[str, object]] = {}
-    for filepath, relative_name, benchmark_name in files:
-        object_name = relative_name.replace(os.sep, "/").lstrip("/")[:256]
-        signature = _file_signature(filepath, benchmark_name)
+    object_names = [object_name for _, object_name, _, _ in files]
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+        computed = list(
+            executor.map(
+                _file_signature,
+                [filepath for filepath, _, _, _ in files],
+                [benchmark_name for _, _, benchmark_name, _ in files],
+                [None if force else known_files.get(name) for name in object_names],
+            )
+        )
+    for (filepath, object_name, benchmark_name, size), signature in zip(
+        files, computed
+    ):
         signatures[object_name] = signature
         known_signature = {
             key: known_files.get(object_name, {}).get(key)
             for key in ("size", "mtime_ns", "hash", "benchmark_name")
         }
         if force or known_signature != signature:
-            changed.append((filepath, relative_name, benchmark_name))
+            changed.append((filepath, object_name, benchmark_name, size))
     return changed, state, signatures
 
 
@@ -150,68 +191,171 @@ def mark_synced(
     _save_sync_state(state)
 
 
-def list_files_upload() -> list[tuple[str, str, str | None]]:
+def _scan_files(root: str | os.PathLike) -> Iterator[tuple[str, str, int]]:
+    """Recursively yield ``(path, relative_name, size)`` for files under ``root``.
+
+    Uses ``os.scandir`` so file sizes come from one stat per file; unreadable or
+    missing directories are skipped like ``os.walk`` does. Hidden entries,
+    symlinks and special files (sockets, FIFOs) are skipped using the file
+    type ``readdir`` already reported.
+    """
+    root = os.fspath(root)
+    prefix = os.path.join(root, "")  # every entry.path starts with this
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.name != "tokens":
+                    yield (
+                        entry.path,
+                        entry.path.removeprefix(prefix),
+                        entry.stat().st_size,
+                    )
+
+
+def list_files_upload() -> list[tuple[str, str, str | None, int]]:
     """Walk ``JOBS_DEFAULT`` and collect every file that should be uploaded.
 
     Input: none (always scans the configured user root).
-    Output: list of ``(absolute_path, relative_archive_name, benchmark_name)`` tuples.
+    Output: list of ``(absolute_path, object_name, benchmark_name, size)`` tuples,
+    where ``object_name`` is the relative path already normalised to the
+    ``/``-separated, 256-character storage key.
     """
-    files: list[tuple[str, str, str | None]] = []
+    files: list[tuple[str, str, str | None, int]] = []
     job_benchmarks = _job_id_benchmark_map()
 
-    #
-    for root, _, filenames in os.walk(JOBS_DEFAULT):
-        for filename in filenames:
-            if filename == "tokens":
-                continue
-            filepath = os.path.join(root, filename)
-            archive_name = os.path.relpath(filepath, JOBS_DEFAULT)
+    for root in (JOBS_DEFAULT, SLURM_DEFAULT):
+        for filepath, archive_name, size in _scan_files(root):
             files.append(
-                (filepath, archive_name, _benchmark_for_file(filepath, job_benchmarks))
-            )
-
-    for root, _, filenames in os.walk(SLURM_DEFAULT):
-        for filename in filenames:
-            if filename == "tokens":
-                continue
-            filepath = os.path.join(root, filename)
-            archive_name = os.path.relpath(filepath, SLURM_DEFAULT)
-            files.append(
-                (filepath, archive_name, _benchmark_for_file(filepath, job_benchmarks))
+                (
+                    filepath,
+                    archive_name.replace(os.sep, "/").lstrip("/")[:256],
+                    _benchmark_for_file(filepath, job_benchmarks),
+                    size,
+                )
             )
 
     click.echo(f"Found {len(files)} files to upload.")
     return files
 
 
-def upload_one(
-    index: int,
+def server_reachable(timeout: float = 2.0) -> bool:
+    """Probe the API before scanning and hashing the local tree.
+
+    Input: connect/read timeout in seconds.
+    Output: ``True`` when the server answers below 500 (there is no dedicated
+    health route, so 4xx still means the API is up); ``False`` on 5xx from a
+    proxy or gateway, connection errors, or timeouts.
+    """
+    try:
+        # Shares the auth session, so the connection opened for the token is reused
+        response = api_session().head(BASE_URL, timeout=(timeout, timeout))
+    except requests.RequestException:
+        return False
+    return response.status_code < 500
+
+
+def _upload_session(workers: int) -> requests.Session:
+    """Build a session whose connection pools fit ``workers`` parallel uploads.
+
+    Input: number of upload worker threads.
+    Output: ``requests.Session`` with pooled adapters for HTTP and HTTPS.
+    """
+    session = requests.Session()
+    # Only connection errors are retried: a streamed body cannot be replayed.
+    retries = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.2)
+    adapter = HTTPAdapter(
+        pool_connections=2, pool_maxsize=max(1, workers) * 2, max_retries=retries
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def presign_batch(
+    session: requests.Session,
+    access_token: str,
+    objects: list[tuple[str, str | None]],
+) -> dict[str, dict]:
+    """Fetch presigned upload targets for many objects in few round-trips.
+
+    Input: HTTP session, auth token, list of ``(object_name, benchmark_name)`` pairs.
+    Output: mapping of object name to presign body (``url``/``headers``); objects
+    missing from the mapping must be presigned one by one, e.g. when the server
+    has no batch endpoint.
+    """
+    presigned: dict[str, dict] = {}
+    for start in range(0, len(objects), PRESIGN_BATCH_SIZE):
+        batch = objects[start : start + PRESIGN_BATCH_SIZE]
+        response = session.post(
+            f"{BASE_URL}/storage/presign/upload/batch",
+            json={
+                "objects": [
+                    {
+                        "object_name": object_name,
+                        **(
+                            {"benchmark_name": benchmark_name} if benchmark_name else {}
+                        ),
+                    }
+                    for object_name, benchmark_name in batch
+                ]
+            },
+            headers={"Authorization": f"Bearer {access_token}"},
+            timeout=(10, 60),
+        )
+        if response.status_code != 200:
+            break
+        presigned.update(response.json().get("uploads", {}))
+    return presigned
+
+
+def presign_one(
+    session: requests.Session,
     access_token: str,
-    filepath: str,
     object_name: str,
     benchmark_name: str | None = None,
-) -> tuple[str, bool]:
-    """Upload one file while updating the row ``index`` in the progress table.
+) -> tuple[dict | None, int]:
+    """Request a presigned upload target for a single object.
 
-    Input: row index, auth token, local path, and S3-style object name.
-    Output: tuple of ``(object_name, success_flag)``.
+    Input: HTTP session, auth token, object name and optional benchmark name.
+    Output: tuple of (presign body or ``None`` on failure, HTTP status code).
     """
-    session = requests.Session()
-    session.headers.update({"Authorization": f"Bearer {access_token}"})
-
     response = session.post(
         f"{BASE_URL}/storage/presign/upload",
         params={
             "object_name": object_name,
             **({"benchmark_name": benchmark_name} if benchmark_name else {}),
         },
+        headers={"Authorization": f"Bearer {access_token}"},
         timeout=(10, 30),
     )
     if response.status_code != 200:
-        table_update(index, f"✗ {object_name}  [presign {response.status_code}]")
-        return object_name, False
+        return None, response.status_code
+    return response.json(), response.status_code
+
 
-    presign_body = response.json()
+def _put_presigned(
+    session: requests.Session,
+    presign_body: dict,
+    index: int,
+    filepath: str,
+    object_name: str,
+    file_size: int,
+) -> requests.Response:
+    """PUT one file to a presigned target, streaming progress into row ``index``.
+
+    Input: HTTP session, presign body (``url``/``headers``), row index, local
+    path, object name and file size in bytes.
+    Output: the PUT response.
+    """
     upload_url = presign_body["url"]
     upload_headers = {
         str(key): str(value)
@@ -221,11 +365,10 @@ def upload_one(
 
     if TUNNELLING_URL:
         upload_url = presign_body["url"].replace(f"{SERVER_URL}:9000", MINIO_TUNNEL_URL)
-    content_type = mimetypes.guess_type(object_name)[0] or "application/octet-stream"
-    file_size = os.path.getsize(filepath)
+    content_type = _content_type("".join(pathlib.PurePosixPath(object_name).suffixes))
 
     if file_size == 0:
-        put_response = requests.put(
+        return session.put(
             upload_url,
             data=b"",
             headers={
@@ -235,20 +378,14 @@ def upload_one(
             },
             timeout=(10, 30),
         )
-        table_update(
-            index, f"{object_name[:24]:<24} ✓ zero-byte [{put_response.status_code}]"
-        )
-        return object_name, put_response.ok
 
     start_time = time.time()
     progress_file = ProgressFile(
         filepath,
-        lambda sent, total: table_update(
-            index, pac_line(object_name, sent, total, start_time)
-        ),
+        lambda sent, total: table_progress(index, object_name, sent, total, start_time),
     )
     try:
-        put_response = requests.put(
+        return session.put(
             upload_url,
             data=progress_file,
             headers={
@@ -261,6 +398,67 @@ def upload_one(
     finally:
         progress_file.close()
 
+
+def upload_one(
+    index: int,
+    access_token: str,
+    filepath: str,
+    object_name: str,
+    benchmark_name: str | None = None,
+    session: requests.Session | None = None,
+    presign_body: dict | None = None,
+    file_size: int | None = None,
+    presign_future: Future | None = None,
+) -> tuple[str, bool]:
+    """Upload one file while updating the row ``index`` in the progress table.
+
+    Input: row index, auth token, local path, S3-style object name, an optional
+    session whose connections are reused across uploads, an optional presign
+    body obtained ahead of time via ``presign_batch`` (or a future resolving to
+    the ``presign_one`` result), and the file size when the caller already
+    knows it.
+    Output: tuple of ``(object_name, success_flag)``.
+
+    A URL presigned ahead of time may expire before a long sync reaches it, so
+    a 403 on such a PUT triggers one fresh ``presign_one`` and a single retry.
+    """
+    if session is None:
+        session = requests.Session()
+
+    presigned_ahead = presign_body is not None or presign_future is not None
+    if presign_body is None:
+        presign_body, status_code = (
+            presign_future.result()
+            if presign_future is not None
+            else presign_one(session, access_token, object_name, benchmark_name)
+        )
+        if presign_body is None:
+            table_update(index, f"✗ {object_name}  [presign {status_code}]")
+            return object_name, False
+
+    if file_size is None:
+        file_size = os.path.getsize(filepath)
+
+    put_response = _put_presigned(
+        session, presign_body, index, filepath, object_name, file_size
+    )
+    if put_response.status_code == 403 and presigned_ahead:
+        presign_body, status_code = presign_one(
+            session, access_token, object_name, benchmark_name
+        )
+        if presign_body is None:
+            table_update(index, f"✗ {object_name}  [presign {status_code}]")
+            return object_name, False
+        put_response = _put_presigned(
+            session, presign_body, index, filepath, object_name, file_size
+        )
+
+    if file_size == 0:
+        table_update(
+            index, f"{object_name[:24]:<24} ✓ zero-byte [{put_response.status_code}]"
+        )
+        return object_name, put_response.ok
+
     final_status = (
         f"{object_name[:24]:<24} ✓ done"
         if put_response.ok
@@ -272,30 +470,87 @@ def upload_one(
 
 def upload_many(
     access_token: str,
-    indexed_files: Iterable[tuple[int, tuple[str, str, str | None]]],
+    indexed_files: Iterable[tuple[int, tuple[str, str, str | None, int]]],
     workers: int = 4,
 ) -> list[tuple[str, bool]]:
     """Upload multiple files concurrently using a worker pool.
 
-    Input: access token, iterable of ``(row_index, file_tuple)`` pairs, worker count.
+    Input: access token, iterable of ``(row_index, file_tuple)`` pairs whose
+    tuples carry normalised object names from ``list_files_upload``, worker count.
     Output: list of ``(object_name, success_flag)`` results collected from workers.
+
+    Presigned URLs are requested up front via ``presign_batch``; a PUT whose
+    URL expired in the meantime is re-presigned once by ``upload_one``. Files the
+    batch could not cover are presigned by a small separate pool that stays
+    ``PRESIGN_LOOKAHEAD`` uploads per worker ahead, so each presign round-trip
+    overlaps an earlier PUT. All workers share one pooled ``requests.Session``
+    so presign and PUT connections stay alive between uploads.
     """
+    uploads = [
+        (idx, filepath, object_name, benchmark_name, size)
+        for idx, (filepath, object_name, benchmark_name, size) in indexed_files
+    ]
     results: list[tuple[str, bool]] = []
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = [
-            executor.submit(
-                upload_one,
-                idx,
-                access_token,
-                filepath,
-                object_name,
-                benchmark_name,
-            )
-            for idx, (filepath, relative_name, benchmark_name) in indexed_files
-            for object_name in [relative_name.replace(os.sep, "/").lstrip("/")[:256]]
+    with _upload_session(workers) as session:
+        presigned = presign_batch(
+            session,
+            access_token,
+            [
+                (object_name, benchmark_name)
+                for _, _, object_name, benchmark_name, _ in uploads
+            ],
+        )
+        # Keyed by row index: two files may share an object name (jobs and
+        # Slurm roots, or truncation), and each still needs its own presign.
+        pending = [
+            (idx, object_name, benchmark_name)
+            for idx, _, object_name, benchmark_name, _ in uploads
+            if object_name not in presigned
         ]
-        for future in as_completed(futures):
-            results.append(future.result())
+        position = {idx: pos for pos, (idx, _, _) in enumerate(pending)}
+        lookahead = max(1, workers) * PRESIGN_LOOKAHEAD
+        presign_futures: dict[int, Future] = {}
+        presign_lock = threading.Lock()
+        next_submit = 0  # positions below this were already submitted once
+
+        with (
+            ThreadPoolExecutor(max_workers=2) as presigner,
+            ThreadPoolExecutor(max_workers=workers) as executor,
+        ):
+
+            def presign_ahead(pos: int) -> Future:
+                nonlocal next_submit
+                with presign_lock:
+                    end = min(pos + lookahead, len(pending))
+                    for ahead in range(max(next_submit, pos), end):
+                        _, object_name, benchmark_name = pending[ahead]
+                        presign_futures[ahead] = presigner.submit(
+                            presign_one,
+                            session,
+                            access_token,
+                            object_name,
+                            benchmark_name,
+                        )
+                    next_submit = max(next_submit, end)
+                    return presign_futures.pop(pos)
+
+            def upload(idx, filepath, object_name, benchmark_name, size):
+                pos = position.get(idx)
+                return upload_one(
+                    idx,
+                    access_token,
+                    filepath,
+                    object_name,
+                    benchmark_name,
+                    session=session,
+                    presign_body=presigned.get(object_name),
+                    file_size=size,
+                    presign_future=presign_ahead(pos) if pos is not None else None,
+                )
+
+            futures = [executor.submit(upload, *item) for item in uploads]
+            for future in as_completed(futures):
+                results.append(future.result())
     return results
 
 
@@ -335,10 +590,11 @@ def sync(jobs: int, force: bool):
             click.echo("Login failed. Cannot sync.")
             return False
 
-    from .cli_auth import active_username
-
     username = active_username()
     click.echo(f"Active account: {username or 'unknown'}")
+    if not server_reachable():
+        click.echo(f"Server {BASE_URL} is unreachable. Cannot sync.")
+        return False
     files = list_files_upload()
     if not files:
         click.echo("No files to sync.")
@@ -352,7 +608,7 @@ def sync(jobs: int, force: bool):
         click.echo(f"No changed files to sync. Skipped {skipped} unchanged file(s).")
         return True
 
-    total_size = sum(os.path.getsize(filepath) for filepath, _, _ in files_to_upload)
+    total_size = sum(size for _, _, _, size in files_to_upload)
     click.echo(
         f":: Synchronizing {len(files_to_upload)} changed file(s) "
         f"({skipped} skipped, {_human_readable_size(total_size)}) with {jobs} jobs"
@@ -363,7 +619,10 @@ def sync(jobs: int, force: bool):
 
     table_start(len(files_to_upload))
     indexed_files = list(enumerate(files_to_upload))
-    results = upload_many(access_token, indexed_files, workers=jobs)
+    try:
+        results = upload_many(access_token, indexed_files, workers=jobs)
+    finally:
+        table_stop()
     mark_synced(sync_state, username=username, results=results, signatures=signatures)
 
     successful_uploads = sum(1 for _, success in results if success)
@@ -1,6 +1,7 @@
 import importlib.resources as res
 import os
 import pathlib
+import shutil
 import stat
 import subprocess
 import time
@@ -9,6 +10,20 @@ import h5py
 import pandas as pd
 
 
+def _slurm_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+    """
+    Run a SLURM client command, letting CPython use ``posix_spawn`` instead of fork+exec.
+
+    ``subprocess`` only takes the ``posix_spawn`` path when the executable has a
+    directory component and ``close_fds`` is False; our descriptors are
+    non-inheritable by default (PEP 446), so nothing extra leaks to the child.
+    If the command is not on PATH the name is passed through unchanged, so the
+    usual FileNotFoundError is raised.
+    """
+    executable = shutil.which(cmd[0]) or cmd[0]
+    return subprocess.run([executable, *cmd[1:]], close_fds=False, **kwargs)
+
+
 def run_slurm_job(
     bench_name: str, partition: str, nodes: int = 1, exclusive: bool = False
 ):
@@ -47,7 +62,7 @@ def h5_analysis(job_id: str):
     post_cmd = "sh5util -j"
 
     print("Job finished. Generating HDF5 output...")
-    subprocess.run(post_cmd.split() + [str(job_id)], check=True, capture_output=True)
+    _slurm_run(post_cmd.split() + [str(job_id)], check=True, capture_output=True)
 
     result_file = f"job_{job_id}.h5"
     while not os.path.exists(result_file):
@@ -56,7 +71,7 @@ def h5_analysis(job_id: str):
     read_h5(result_file)
 
     sacct_cmd = f"sacct --format=jobid,elapsed,AveCPUFreq,ConsumedEnergy,ConsumedEnergyRaw -P -j {job_id}"
-    result2 = subprocess.run(sacct_cmd.split(), check=True, capture_output=True)
+    result2 = _slurm_run(sacct_cmd.split(), check=True, capture_output=True)
     print(result2.stdout.decode("utf-8"))
 
 
@@ -159,14 +174,14 @@ def sbatch_launch(
             cmd += ["--exclusive"]
 
         try:
-            completed = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            completed = _slurm_run(cmd, check=True, capture_output=True, text=True)
         except subprocess.CalledProcessError as e:
             print("STDERR:", e.stderr)
             raise
 
         job_id = int(completed.stdout.strip().split(";")[0])
         os.makedirs(jobs_root / job_label / f"job_{job_id}", exist_ok=True)
-        subprocess.run(["scontrol", "release", str(job_id)], check=True)
+        _slurm_run(["scontrol", "release", str(job_id)], check=True)
         return job_id
 
 
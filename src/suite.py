@@ -1,91 +1,98 @@
 import os
-import string
 import subprocess
+import sys
 
 import click
 
+# Directory menu letters a.-z.; entries beyond 'z' are labelled [26], [27], ...
+_DIR_LABELS = tuple(chr(ord("a") + i) for i in range(26))
 
-@click.command()
-def list(dir: bool) -> None:
-    """
 
-    Recursively explores directories and executes Python files via user input.
+def _scan_dir(path: str) -> tuple[list[str], list[str]]:
+    """
+    Lists the visible files and directories of `path` in a single directory pass.
 
     Parameters:
-        path (str): The starting directory to explore.
+        path (str): Directory to scan.
+
+    Returns:
+        tuple[list[str], list[str]]: File names and directory names, skipping
+        entries that start with '.' or '_'.
+    """
+    files = []
+    dirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.startswith((".", "_")):
+                continue  # Skip hidden and special-named files/dirs
+            if entry.is_file():
+                files.append(entry.name)
+            elif entry.is_dir():
+                dirs.append(entry.name)
+    return files, dirs
+
+
+@click.command()
+def list() -> None:
+    """
+
+    Interactively explores directories and executes Python files via user input.
 
     Behavior:
-        - Lists all non-hidden files and directories in `path`.
+        - Starts in `./benchmarks` and lists all non-hidden files and directories.
         - Files are labeled numerically (1., 2., 3., ...).
         - Directories are labeled alphabetically (a., b., c., ...).
         - User can:
             • Enter a number to execute a selected Python file.
             • Enter a letter to descend into a selected subdirectory.
-        - Recurses on directory selection.
-        - Executes selected file using subprocess and prints its output.
+        - Descends in a loop on directory selection, so nesting depth does not
+          grow the call stack.
+        - Executes selected file using subprocess, streaming its output.
 
     Notes:
         - Files or directories that start with '.' or '_' are excluded.
         - Only Python files that can be executed with `python` will be run.
-        - Recursion allows navigating deeply nested folder structures.
     """
 
-    cwd = os.getcwd()
-    path = cwd + "/benchmarks"
-
-    escape_chars = [".", "_"]  # Skip hidden and special-named files/dirs
-
-    # List visible files
-    files = [
-        f
-        for f in os.listdir(path)
-        if f[0] not in escape_chars and os.path.isfile(os.path.join(path, f))
-    ]
-
-    # List visible directories
-    dirs = [
-        d
-        for d in os.listdir(path)
-        if d[0] not in escape_chars and os.path.isdir(os.path.join(path, d))
-    ]
-
-    # Display file options with numeric labels: 1., 2., ...
-    if files:
-        print("-files---------")
-        for i, f in enumerate(files):
-            print(f"{i + 1}. {f}")
-
-    # Display directory options with alphabetic labels: a., b., ...
-    if dirs:
-        print("-directories---")
-        for i, d in enumerate(dirs):
-            label = (
-                string.ascii_lowercase[i] if i < 26 else f"[{i}]"
-            )  # Extend beyond 'z' if needed
-            print(f"{label}. {d}")
-    print("")
-
-    choice = input("Enter file number or directory letter: ")
-
-    # If input is a number corresponding to a file, run it
-    if choice.isdigit() and 1 <= int(choice) <= len(files):
-        file = files[int(choice) - 1]
-        print(f"Run: {file}")
-        result = subprocess.run(
-            ["python", os.path.join(path, file)], capture_output=True, text=True
-        )
-        print(result.stdout)
-        print(result.stderr)
-        print(f"Exit code: {result.returncode}")
-
-    # If input is a letter corresponding to a directory, recurse into it
-    elif choice in string.ascii_lowercase[: len(dirs)]:
-        dir_index = string.ascii_lowercase.index(choice)
-        new_path = os.path.join(path, dirs[dir_index])
-        list(new_path)
-
-    else:
-        print("Invalid Input")
+    path = os.path.join(os.getcwd(), "benchmarks")
+
+    while True:
+        files, dirs = _scan_dir(path)
+
+        # Display file options with numeric labels: 1., 2., ...
+        if files:
+            print("-files---------")
+            for i, f in enumerate(files):
+                print(f"{i + 1}. {f}")
+
+        # Display directory options with alphabetic labels: a., b., ...
+        if dirs:
+            print("-directories---")
+            for i, d in enumerate(dirs):
+                label = _DIR_LABELS[i] if i < len(_DIR_LABELS) else f"[{i}]"
+                print(f"{label}. {d}")
+        print("")
+
+        sys.stdout.write("Enter file number or directory letter: ")
+        sys.stdout.flush()
+        choice = sys.stdin.readline().strip()
+
+        # If input is a number corresponding to a file, run it
+        if choice.isdigit() and 1 <= int(choice) <= len(files):
+            file = files[int(choice) - 1]
+            print(f"Run: {file}")
+            # Inherit stdout/stderr so output streams live instead of being buffered
+            result = subprocess.run([sys.executable, os.path.join(path, file)])
+            print(f"Exit code: {result.returncode}")
+
+        # If input is a letter corresponding to a directory, descend into it
+        elif len(choice) == 1 and "a" <= choice < chr(ord("a") + min(len(dirs), 26)):
+            path = os.path.join(path, dirs[ord(choice) - ord("a")])
+            continue
+
+        else:
+            print("Invalid Input")
+        return
 
 
 if __name__ == "__main__":
@@ -44,7 +44,11 @@ def test_likwid_benchmarks_use_valid_likwid_group_option() -> None:
         text = script_path.read_text(encoding="utf-8")
         assert "0-24-g" not in text, script_path
         if "likwid-perfctr" in text:
-            assert " -g FLOPS_DP" in text, script_path
+            assert " -g FLOPS_DP" in text or (
+                ' -g "$LIKWID_GROUP"' in text
+                and "LIKWID_GROUP=FLOPS_DP" in text
+                and "LIKWID_GROUP=FLOPS_SP" in text
+            ), script_path
 
 
 def test_known_fixed_benchmarks_invoke_their_package_modules() -> None:
@@ -73,3 +77,9 @@ def test_flops_matrix_mul_defines_dest_before_use() -> None:
     text = _job_script("flops_matrix_mul")
     assert "DEST=" in text
     assert text.index("DEST=") < text.index("$DEST")
+
+
+def test_flops_matrix_mul_profiles_single_precision_runs_as_flops_sp() -> None:
+    text = _job_script("flops_matrix_mul")
+    assert 'export GEMM_DTYPE="${GEMM_DTYPE:-f64}"' in text
+    assert text.index("LIKWID_GROUP=FLOPS_SP") < text.index("likwid-perfctr")
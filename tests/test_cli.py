@@ -146,7 +146,7 @@ def test_run_user_dir(tmp_user_root, tmp_path, monkeypatch):
     sh.chmod(0o755)
 
     calls = []
-    monkeypatch.setattr(cli.subprocess, "run", lambda args: calls.append(args))
+    monkeypatch.setattr(os, "execvp", lambda file, args: calls.append(args))
 
     r = CliRunner().invoke(cli.run, ["u"], env=env)
     assert r.exit_code == 0, r.output
@@ -162,11 +162,143 @@ def test_run_builtin(monkeypatch):
     fake_pkg.mkdir(exist_ok=True)
     (fake_pkg / "std.py").write_text("# x")
     monkeypatch.setattr(cli.res, "files", lambda _: fake_pkg)
+    from benchwrap import cli_benchmarks
+
     calls = []
-    monkeypatch.setattr(subprocess, "run", lambda args: calls.append(args))
+    monkeypatch.setattr(
+        cli_benchmarks.runpy,
+        "run_module",
+        lambda module, **kw: calls.append((module, list(sys.argv[1:]), kw)),
+    )
+    r = CliRunner().invoke(cli.run, ["std", "--partition", "p1", "--exclusive"])
+    assert r.exit_code == 0, r.output
+    assert calls == [
+        (
+            "benchwrap.executors.std",
+            ["--partition", "p1", "--exclusive"],
+            {"run_name": "__main__", "alter_sys": True},
+        )
+    ]
+
+
+def test_run_builtin_failure_is_reported(monkeypatch):
+    import benchwrap.cli as cli
+
+    importlib.reload(cli)
+    fake_pkg = pathlib.Path.cwd() / "fakepkg"
+    fake_pkg.mkdir(exist_ok=True)
+    (fake_pkg / "std.py").write_text("# x")
+    monkeypatch.setattr(cli.res, "files", lambda _: fake_pkg)
+    from benchwrap import cli_benchmarks
+
+    def boom(module, **kw):
+        raise RuntimeError("executor broke")
+
+    monkeypatch.setattr(cli_benchmarks.runpy, "run_module", boom)
     r = CliRunner().invoke(cli.run, ["std"])
-    assert r.exit_code == 0
-    assert any("-m" in c for c in calls)
+    assert r.exit_code == 0, r.output
+    assert "RuntimeError: executor broke" in r.stderr
+    assert "[warn] benchwrap.executors.std failed" in r.stderr
+
+
+def test_run_exact_name_beats_prefix_siblings(tmp_user_root, tmp_path, monkeypatch):
+    import benchwrap.cli as cli
+
+    importlib.reload(cli)
+    empty_pkg = tmp_path / "stdpkg"
+    empty_pkg.mkdir()
+    monkeypatch.setattr(cli.res, "files", lambda _: empty_pkg)
+    for name in ("u", "u_long"):
+        d = tmp_user_root / name
+        d.mkdir(parents=True)
+        (d / "job_start.sh").write_text("echo hi")
+
+    calls = []
+    monkeypatch.setattr(os, "execvp", lambda file, args: calls.append(args))
+    cli.run_impl("u", None, None, None, None, False, user_root=tmp_user_root)
+    assert calls[-1][1] == str(tmp_user_root / "u" / "job_start.sh")
+
+    calls.clear()
+    cli.run_impl("u_", None, None, None, None, False, user_root=tmp_user_root)
+    assert calls[-1][1] == str(tmp_user_root / "u_long" / "job_start.sh")
+
+
+def test_resolve_choice_bisects_prefix_range():
+    from benchwrap import cli_benchmarks
+
+    kinds, names = cli_benchmarks._benchmark_index(("ab", "b"), ("abc",), ("abd", "c"))
+    assert names == ("ab", "abc", "abd", "b", "c")
+    assert cli_benchmarks._resolve_choice("ab", kinds, names) == ("ab", ["ab"])
+    assert cli_benchmarks._resolve_choice("abc", kinds, names) == ("abc", ["abc"])
+    assert cli_benchmarks._resolve_choice("b", kinds, names) == ("b", ["b"])
+    assert cli_benchmarks._resolve_choice("a", kinds, names) == (
+        "a",
+        ["ab", "abc", "abd"],
+    )
+    assert cli_benchmarks._resolve_choice("z", kinds, names) == ("z", [])
+
+
+def test_user_scan_sees_new_benchmarks(tmp_user_root):
+    from benchwrap import cli_benchmarks
+
+    tmp_user_root.mkdir(parents=True)
+    (tmp_user_root / "a.py").write_text("print(1)")
+    (tmp_user_root / "_helper.py").write_text("")
+    (tmp_user_root / ".hidden").mkdir()
+    (tmp_user_root / ".hidden" / "job_start.sh").write_text("")
+    assert cli_benchmarks._iter_user_content(tmp_user_root) == (["a"], [])
+
+    os.utime(tmp_user_root, ns=(0, 0))  # pin mtime so only a real change bumps it
+    assert cli_benchmarks._iter_user_content(tmp_user_root) == (["a"], [])
+    (tmp_user_root / "b.py").write_text("print(2)")
+    assert sorted(cli_benchmarks._iter_user_content(tmp_user_root)[0]) == ["a", "b"]
+
+    (tmp_user_root / "d").mkdir()
+    os.utime(tmp_user_root, ns=(1, 1))
+    os.utime(tmp_user_root / "d", ns=(0, 0))
+    assert cli_benchmarks._iter_user_content(tmp_user_root)[1] == []
+    # Adding the launcher bumps only the subdirectory's mtime, not the root's
+    (tmp_user_root / "d" / "job_start.sh").write_text("echo hi")
+    os.utime(tmp_user_root, ns=(1, 1))
+    assert cli_benchmarks._iter_user_content(tmp_user_root)[1] == ["d"]
+
+
+def test_cli_import_defers_http_stack():
+    code = (
+        "import sys, benchwrap.cli as cli; "
+        "print('requests' in sys.modules, cli.sync.name, 'requests' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        check=True,
+    ).stdout
+    assert out.split() == ["False", "sync", "True"]
+
+
+def test_help_lists_lazy_commands_without_importing_them():
+    code = (
+        "import sys, benchwrap.cli as cli\n"
+        "try:\n    cli.benchwrap(['--help'])\n"
+        "except SystemExit:\n    pass\n"
+        "print('requests' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        check=True,
+    ).stdout
+    assert "sync      Synchronize user benchmarks with remote storage." in out
+    assert out.split()[-1] == "False"
+
+    import benchwrap.cli as cli
+
+    for name, summary in cli.benchwrap.lazy_help.items():
+        assert cli.benchwrap.get_command(None, name).help.splitlines()[0] == summary
 
 
 def test_logout_clears_token_file(tmp_path, monkeypatch):
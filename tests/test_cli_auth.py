@@ -0,0 +1,111 @@
+"""Tests for CLI authentication helpers."""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+from benchwrap import cli_auth
+
+
+def _jwt(payload: dict) -> str:
+    body = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+    return f"header.{body}.sig"
+
+
+def _use_token_file(monkeypatch, tmp_path, state: dict):
+    token_file = tmp_path / "tokens"
+    token_file.write_text(json.dumps(state))
+    monkeypatch.setattr(cli_auth, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(cli_auth, "TOK_FILE", token_file)
+    return token_file
+
+
+def test_get_access_token_reuses_unexpired_token(monkeypatch, tmp_path) -> None:
+    """A stored access token with time left skips the refresh round-trip."""
+    access = _jwt({"exp": time.time() + 3600})
+    _use_token_file(monkeypatch, tmp_path, {"refresh": "r1", "access": access})
+
+    def fail_post(*args, **kwargs):
+        raise AssertionError("refresh should not be requested")
+
+    monkeypatch.setattr(
+        cli_auth, "api_session", lambda: SimpleNamespace(post=fail_post)
+    )
+
+    assert cli_auth.get_access_token() == access
+
+
+def test_get_access_token_refreshes_expiring_token(monkeypatch, tmp_path) -> None:
+    """Tokens close to expiry are exchanged and the new one is stored."""
+    stale = _jwt({"exp": time.time() + 10})
+    fresh = _jwt({"exp": time.time() + 3600, "username": "alice"})
+    token_file = _use_token_file(
+        monkeypatch, tmp_path, {"refresh": "r1", "access": stale}
+    )
+    response = SimpleNamespace(
+        status_code=200, json=lambda: {"access": fresh, "refresh": "r2"}
+    )
+    monkeypatch.setattr(
+        cli_auth,
+        "api_session",
+        lambda: SimpleNamespace(post=lambda *args, **kwargs: response),
+    )
+
+    assert cli_auth.get_access_token() == fresh
+    assert json.loads(token_file.read_text()) == {
+        "access": fresh,
+        "refresh": "r2",
+        "username": "alice",
+    }
+
+
+def test_logout_path_does_not_import_requests() -> None:
+    """Loading the auth helpers leaves the HTTP stack for the commands that use it."""
+    code = "import sys, benchwrap.cli_auth; print('requests' in sys.modules)"
+    src = pathlib.Path(__file__).parent.parent / "src"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(src)},
+        check=True,
+    ).stdout
+    assert out.strip() == "False"
+
+
+def test_token_state_is_parsed_once_until_the_file_changes(
+    monkeypatch, tmp_path
+) -> None:
+    """Repeated auth checks reuse the parsed token file; a rewrite invalidates it."""
+    token_file = _use_token_file(monkeypatch, tmp_path, {"refresh": "r1"})
+    parsed = []
+    parse = cli_auth._parse_token_state
+    monkeypatch.setattr(
+        cli_auth, "_parse_token_state", lambda raw: parsed.append(raw) or parse(raw)
+    )
+
+    assert cli_auth.registered()
+    assert cli_auth._read_token_state() == {"refresh": "r1"}
+    assert len(parsed) == 1
+
+    token_file.write_text(json.dumps({"refresh": "r2-longer"}))
+    assert cli_auth._read_token_state() == {"refresh": "r2-longer"}
+    assert len(parsed) == 2
+
+
+def test_token_file_is_rewritten_owner_only(monkeypatch, tmp_path) -> None:
+    """Persisted credentials end up 0600 even if an older file was world-readable."""
+    token_file = _use_token_file(monkeypatch, tmp_path, {"refresh": "old"})
+    token_file.chmod(0o644)
+
+    cli_auth._write_token_state(refresh="r2", username="alice")
+
+    assert token_file.stat().st_mode & 0o777 == 0o600
+    assert cli_auth._read_token_state() == {"refresh": "r2", "username": "alice"}
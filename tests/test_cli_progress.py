@@ -0,0 +1,90 @@
+"""Tests for upload progress helpers."""
+
+from __future__ import annotations
+
+from benchwrap import cli_progress
+
+
+def test_progress_file_throttles_callbacks(monkeypatch, tmp_path) -> None:
+    """Reads within one interval report once, plus the final byte count."""
+    source = tmp_path / "blob.bin"
+    source.write_bytes(b"x" * 10)
+    calls = []
+    monkeypatch.setattr(cli_progress.time, "monotonic", lambda: 100.0)
+    progress_file = cli_progress.ProgressFile(
+        str(source), lambda sent, total: calls.append((sent, total)), chunk_size=3
+    )
+
+    try:
+        while progress_file.read():
+            pass
+    finally:
+        progress_file.close()
+
+    assert calls == [(3, 10), (10, 10)]
+
+
+def test_progress_file_streams_whole_file(tmp_path) -> None:
+    """Slices handed to the HTTP layer reassemble into the original bytes."""
+    payload = bytes(range(256)) * 40
+    source = tmp_path / "blob.bin"
+    source.write_bytes(payload)
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+
+    progress_file = cli_progress.ProgressFile(
+        str(source), lambda sent, total: None, chunk_size=1000
+    )
+    chunks = []
+    try:
+        while chunk := progress_file.read(16):
+            chunks.append(bytes(chunk))
+    finally:
+        progress_file.close()
+    assert b"".join(chunks) == payload
+    assert len(chunks) == 11
+
+    progress_file = cli_progress.ProgressFile(str(empty), lambda sent, total: None)
+    assert not progress_file.read()
+    progress_file.close()
+
+
+def test_rail_keeps_width_and_dot_spacing() -> None:
+    """The mouth sits at ``position`` with dots every third cell after it."""
+    assert cli_progress._rail(0, 8, "C") == "C  o  o "
+    assert cli_progress._rail(3, 8, "c") == "---c  o "
+    assert cli_progress._rail(7, 8, "C") == "-------C"
+    assert len(cli_progress._rail(5, 200, "C")) == 200
+
+
+def test_table_rows_are_drawn_on_stop(monkeypatch, capsys) -> None:
+    """Buffered row updates should reach the terminal once the table stops."""
+    monkeypatch.setattr(cli_progress, "REFRESH_INTERVAL", 3600)
+    cli_progress.table_start(2)
+    cli_progress.table_update(1, "old")
+    cli_progress.table_update(1, "second row")
+    cli_progress.table_stop()
+
+    out = capsys.readouterr().out
+    assert "second row" in out
+    assert "old" not in out
+
+
+def test_table_progress_is_formatted_by_the_renderer(monkeypatch, capsys) -> None:
+    """Workers hand over raw counters; only the last state per row is rendered."""
+    monkeypatch.setattr(cli_progress, "REFRESH_INTERVAL", 3600)
+    rendered = []
+    pac_line = cli_progress.pac_line
+    monkeypatch.setattr(
+        cli_progress,
+        "pac_line",
+        lambda *args: rendered.append(args[1]) or pac_line(*args),
+    )
+    cli_progress.table_start(1)
+    for sent in (1, 2, 3):
+        cli_progress.table_progress(0, "results.h5", sent, 4, 0.0)
+    assert rendered == []
+    cli_progress.table_stop()
+
+    assert rendered == [3]
+    assert "results.h5" in capsys.readouterr().out
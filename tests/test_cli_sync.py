@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import threading
+import time
 from types import SimpleNamespace
 
 from click.testing import CliRunner
@@ -16,10 +19,9 @@ def test_upload_one_sends_presigned_headers(monkeypatch, tmp_path) -> None:
     seen = {}
 
     class Session:
-        headers = {}
-
-        def post(self, url, params, timeout):
+        def post(self, url, params, headers, timeout):
             seen["params"] = params
+            seen["presign_headers"] = headers
             return SimpleNamespace(
                 status_code=200,
                 json=lambda: {
@@ -28,13 +30,12 @@ def test_upload_one_sends_presigned_headers(monkeypatch, tmp_path) -> None:
                 },
             )
 
-    def fake_put(url, data, headers, timeout):
-        seen["url"] = url
-        seen["headers"] = headers
-        return SimpleNamespace(ok=True, status_code=200)
+        def put(self, url, data, headers, timeout):
+            seen["url"] = url
+            seen["headers"] = headers
+            return SimpleNamespace(ok=True, status_code=200)
 
     monkeypatch.setattr(cli_sync.requests, "Session", Session)
-    monkeypatch.setattr(cli_sync.requests, "put", fake_put)
     monkeypatch.setattr(cli_sync, "table_update", lambda *args, **kwargs: None)
 
     name, ok = cli_sync.upload_one(0, "token", str(source), "result.h5", "stream_triad")
@@ -42,6 +43,8 @@ def test_upload_one_sends_presigned_headers(monkeypatch, tmp_path) -> None:
     assert ok is True
     assert name == "result.h5"
     assert seen["params"]["benchmark_name"] == "stream_triad"
+    assert seen["presign_headers"]["Authorization"] == "Bearer token"
+    assert "Authorization" not in seen["headers"]
     assert seen["url"] == "https://s3.example/upload"
     assert seen["headers"]["x-amz-acl"] == "private"
     assert seen["headers"]["Content-Length"] == "3"
@@ -54,21 +57,17 @@ def test_upload_one_sends_benchmark_name(monkeypatch, tmp_path) -> None:
     seen = {}
 
     class Session:
-        headers = {}
-
-        def post(self, url, params, timeout):
+        def post(self, url, params, headers, timeout):
             seen["params"] = params
             return SimpleNamespace(
                 status_code=200,
                 json=lambda: {"url": "https://s3.example/upload", "headers": {}},
             )
 
+        def put(self, *args, **kwargs):
+            return SimpleNamespace(ok=True, status_code=200)
+
     monkeypatch.setattr(cli_sync.requests, "Session", Session)
-    monkeypatch.setattr(
-        cli_sync.requests,
-        "put",
-        lambda *args, **kwargs: SimpleNamespace(ok=True, status_code=200),
-    )
     monkeypatch.setattr(cli_sync, "table_update", lambda *args, **kwargs: None)
 
     _name, ok = cli_sync.upload_one(
@@ -79,6 +78,41 @@ def test_upload_one_sends_benchmark_name(monkeypatch, tmp_path) -> None:
     assert seen["params"]["benchmark_name"] == "flops_matrix_mul_mini"
 
 
+def test_upload_one_represigns_once_when_url_expired(monkeypatch, tmp_path) -> None:
+    """A 403 on an ahead-of-time URL gets one fresh presign and one retry."""
+    source = tmp_path / "result.h5"
+    source.write_bytes(b"abc")
+    put_urls = []
+    presigns = []
+
+    class Session:
+        def post(self, url, params, headers, timeout):
+            presigns.append(params["object_name"])
+            return SimpleNamespace(
+                status_code=200, json=lambda: {"url": "https://s3.example/fresh"}
+            )
+
+        def put(self, url, data, headers, timeout):
+            put_urls.append(url)
+            status = 403 if url.endswith("stale") else 200
+            return SimpleNamespace(ok=status == 200, status_code=status)
+
+    monkeypatch.setattr(cli_sync, "table_update", lambda *args, **kwargs: None)
+
+    _name, ok = cli_sync.upload_one(
+        0,
+        "token",
+        str(source),
+        "result.h5",
+        session=Session(),
+        presign_body={"url": "https://s3.example/stale"},
+    )
+
+    assert ok is True
+    assert presigns == ["result.h5"]
+    assert put_urls == ["https://s3.example/stale", "https://s3.example/fresh"]
+
+
 def test_benchmark_for_slurm_file_uses_job_directory(monkeypatch, tmp_path) -> None:
     """Slurm profile files should map back to their Benchwrap benchmark folder."""
     jobs = tmp_path / "jobs"
@@ -93,18 +127,44 @@ def test_benchmark_for_slurm_file_uses_job_directory(monkeypatch, tmp_path) -> N
     assert cli_sync._benchmark_for_file(str(slurm_file), mapping) == "stream_triad"
 
 
+def test_list_files_upload_reports_sizes(monkeypatch, tmp_path) -> None:
+    """Discovery returns sizes and skips tokens, hidden entries and symlinks."""
+    jobs = tmp_path / "jobs"
+    (jobs / "stream_triad" / "job_1").mkdir(parents=True)
+    (jobs / "stream_triad" / "job_1" / "slurm-1.out").write_bytes(b"hello")
+    (jobs / "tokens").write_text("secret")
+    (jobs / ".DS_Store").write_bytes(b"x")
+    (jobs / ".git").mkdir()
+    (jobs / ".git" / "HEAD").write_text("ref")
+    (jobs / "link.out").symlink_to(jobs / "stream_triad" / "job_1" / "slurm-1.out")
+    monkeypatch.setattr(cli_sync, "JOBS_DEFAULT", jobs)
+    monkeypatch.setattr(cli_sync, "SLURM_DEFAULT", tmp_path / "missing")
+
+    files = cli_sync.list_files_upload()
+
+    assert files == [
+        (
+            str(jobs / "stream_triad" / "job_1" / "slurm-1.out"),
+            os.path.join("stream_triad", "job_1", "slurm-1.out"),
+            "stream_triad",
+            5,
+        )
+    ]
+
+
 def test_sync_accepts_metadata_file_tuples(monkeypatch, tmp_path) -> None:
-    """Sync should handle the 3-tuple produced by metadata-aware discovery."""
+    """Sync should handle the 4-tuple produced by metadata-aware discovery."""
     source = tmp_path / "result.h5"
     source.write_bytes(b"abc")
     monkeypatch.setattr(cli_sync, "DATA_DIR", tmp_path)
     monkeypatch.setattr(cli_sync, "SYNC_STATE_FILE", tmp_path / "sync-state.json")
     monkeypatch.setattr(cli_sync, "registered", lambda: True)
     monkeypatch.setattr(cli_sync, "get_access_token", lambda: "token")
+    monkeypatch.setattr(cli_sync, "server_reachable", lambda: True)
     monkeypatch.setattr(
         cli_sync,
         "list_files_upload",
-        lambda: [(str(source), "result.h5", "stream_triad")],
+        lambda: [(str(source), "result.h5", "stream_triad", 3)],
     )
     monkeypatch.setattr(
         cli_sync, "upload_many", lambda *_args, **_kwargs: [("result.h5", True)]
@@ -125,10 +185,11 @@ def test_sync_skips_unchanged_files(monkeypatch, tmp_path) -> None:
     monkeypatch.setattr(cli_sync, "SYNC_STATE_FILE", tmp_path / "sync-state.json")
     monkeypatch.setattr(cli_sync, "registered", lambda: True)
     monkeypatch.setattr(cli_sync, "get_access_token", lambda: "token")
+    monkeypatch.setattr(cli_sync, "server_reachable", lambda: True)
     monkeypatch.setattr(
         cli_sync,
         "list_files_upload",
-        lambda: [(str(source), "result.h5", "stream_triad")],
+        lambda: [(str(source), "result.h5", "stream_triad", 3)],
     )
     monkeypatch.setattr(cli_sync, "table_start", lambda *_args, **_kwargs: None)
     calls = []
@@ -147,6 +208,29 @@ def test_sync_skips_unchanged_files(monkeypatch, tmp_path) -> None:
     assert "No changed files" in second.output
 
 
+def test_filter_changed_files_reuses_hash_for_same_size_and_mtime(
+    monkeypatch, tmp_path
+) -> None:
+    """Unchanged size+mtime skips rehashing; a touched file is hashed again."""
+    source = tmp_path / "result.h5"
+    source.write_bytes(b"abc")
+    monkeypatch.setattr(cli_sync, "SYNC_STATE_FILE", tmp_path / "sync-state.json")
+    files = [(str(source), "result.h5", None, 3)]
+    changed, state, signatures = cli_sync.filter_changed_files(files, username="u")
+    cli_sync.mark_synced(
+        state, username="u", results=[("result.h5", True)], signatures=signatures
+    )
+
+    hashed = []
+    monkeypatch.setattr(cli_sync, "_fast_hash", lambda path: hashed.append(path))
+    changed, _, _ = cli_sync.filter_changed_files(files, username="u")
+    assert changed == [] and hashed == []
+
+    os.utime(source, ns=(0, 0))
+    changed, _, _ = cli_sync.filter_changed_files(files, username="u")
+    assert changed == files and hashed == [str(source)]
+
+
 def test_sync_force_uploads_unchanged_files(monkeypatch, tmp_path) -> None:
     """--force should preserve the previous reupload-everything behavior."""
     source = tmp_path / "result.h5"
@@ -155,10 +239,11 @@ def test_sync_force_uploads_unchanged_files(monkeypatch, tmp_path) -> None:
     monkeypatch.setattr(cli_sync, "SYNC_STATE_FILE", tmp_path / "sync-state.json")
     monkeypatch.setattr(cli_sync, "registered", lambda: True)
     monkeypatch.setattr(cli_sync, "get_access_token", lambda: "token")
+    monkeypatch.setattr(cli_sync, "server_reachable", lambda: True)
     monkeypatch.setattr(
         cli_sync,
         "list_files_upload",
-        lambda: [(str(source), "result.h5", "stream_triad")],
+        lambda: [(str(source), "result.h5", "stream_triad", 3)],
     )
     monkeypatch.setattr(cli_sync, "table_start", lambda *_args, **_kwargs: None)
     calls = []
@@ -173,3 +258,168 @@ def test_sync_force_uploads_unchanged_files(monkeypatch, tmp_path) -> None:
 
     assert forced.exit_code == 0
     assert len(calls) == 2
+
+
+def test_sync_stops_before_scanning_when_server_is_down(monkeypatch) -> None:
+    """An unreachable API should fail fast without walking the local tree."""
+    monkeypatch.setattr(cli_sync, "registered", lambda: True)
+    monkeypatch.setattr(cli_sync, "get_access_token", lambda: "token")
+    monkeypatch.setattr(cli_sync, "server_reachable", lambda: False)
+
+    def fail_listing():
+        raise AssertionError("files should not be listed")
+
+    monkeypatch.setattr(cli_sync, "list_files_upload", fail_listing)
+
+    result = CliRunner().invoke(cli_sync.sync, ["--jobs", "1"])
+
+    assert result.exit_code == 0
+    assert "unreachable" in result.output
+
+
+def test_upload_many_shares_one_session(monkeypatch) -> None:
+    """All workers should upload over the same pooled session."""
+    sessions = []
+
+    def fake_upload_one(index, token, filepath, object_name, benchmark_name, **kw):
+        sessions.append(kw["session"])
+        return object_name, True
+
+    monkeypatch.setattr(cli_sync, "upload_one", fake_upload_one)
+    monkeypatch.setattr(cli_sync, "presign_batch", lambda *_args: {})
+    monkeypatch.setattr(cli_sync, "presign_one", lambda *_args: ({"url": "u"}, 200))
+    files = [(0, ("/tmp/a", "a", None, 1)), (1, ("/tmp/b", "b", None, 1))]
+
+    results = cli_sync.upload_many("token", files, workers=2)
+
+    assert sorted(results) == [("a", True), ("b", True)]
+    assert len(sessions) == 2 and sessions[0] is sessions[1]
+
+
+def test_upload_many_passes_batch_presigned_urls(monkeypatch) -> None:
+    """Batch-presigned files skip the per-file presign; the rest fall back."""
+    seen = {}
+
+    def fake_upload_one(index, token, filepath, object_name, benchmark_name, **kw):
+        future = kw["presign_future"]
+        seen[object_name] = kw["presign_body"] or future.result()[0]
+        return object_name, True
+
+    presigned_one = []
+
+    def fake_presign_one(session, token, object_name, benchmark_name):
+        presigned_one.append(object_name)
+        return {"url": f"https://s3/{object_name}/single"}, 200
+
+    monkeypatch.setattr(cli_sync, "upload_one", fake_upload_one)
+    monkeypatch.setattr(cli_sync, "presign_one", fake_presign_one)
+    monkeypatch.setattr(
+        cli_sync, "presign_batch", lambda *_args: {"a": {"url": "https://s3/a"}}
+    )
+    files = [(0, ("/tmp/a", "a", None, 1)), (1, ("/tmp/b", "b", None, 1))]
+
+    cli_sync.upload_many("token", files, workers=1)
+
+    assert seen == {"a": {"url": "https://s3/a"}, "b": {"url": "https://s3/b/single"}}
+    assert presigned_one == ["b"]
+
+
+def test_upload_many_presigns_ahead_of_uploads(monkeypatch) -> None:
+    """Per-file presigns for later files start before earlier PUTs finish."""
+    order = []
+
+    def fake_presign_one(session, token, object_name, benchmark_name):
+        order.append(f"presign {object_name}")
+        return {"url": object_name}, 200
+
+    def fake_upload_one(index, token, filepath, object_name, benchmark_name, **kw):
+        kw["presign_future"].result()
+        if object_name == "a":
+            # b's presign is already queued while a is still uploading
+            for _ in range(1000):
+                if "presign b" in order:
+                    break
+                time.sleep(0.001)
+        order.append(f"put {object_name}")
+        return object_name, True
+
+    monkeypatch.setattr(cli_sync, "upload_one", fake_upload_one)
+    monkeypatch.setattr(cli_sync, "presign_one", fake_presign_one)
+    monkeypatch.setattr(cli_sync, "presign_batch", lambda *_args: {})
+    files = [(0, ("/tmp/a", "a", None, 1)), (1, ("/tmp/b", "b", None, 1))]
+
+    cli_sync.upload_many("token", files, workers=1)
+
+    assert order.index("presign b") < order.index("put a")
+
+
+def test_upload_many_presigns_each_pending_file_once(monkeypatch) -> None:
+    """Look-ahead never re-submits a position another worker already took."""
+    presigned = []
+    lock = threading.Lock()
+
+    def fake_presign_one(session, token, object_name, benchmark_name):
+        with lock:
+            presigned.append(object_name)
+        return {"url": object_name}, 200
+
+    def fake_upload_one(index, token, filepath, object_name, benchmark_name, **kw):
+        kw["presign_future"].result()
+        return object_name, True
+
+    monkeypatch.setattr(cli_sync, "upload_one", fake_upload_one)
+    monkeypatch.setattr(cli_sync, "presign_one", fake_presign_one)
+    monkeypatch.setattr(cli_sync, "presign_batch", lambda *_args: {})
+    files = [(i, (f"/tmp/{i}", f"f{i}", None, 1)) for i in range(200)]
+
+    cli_sync.upload_many("token", files, workers=8)
+
+    assert sorted(presigned) == sorted(f"f{i}" for i in range(200))
+
+
+def test_upload_many_uploads_files_sharing_an_object_name(monkeypatch) -> None:
+    """Two rows with the same object name each get their own presign and PUT."""
+    uploaded = []
+
+    def fake_upload_one(index, token, filepath, object_name, benchmark_name, **kw):
+        assert kw["presign_future"].result()[0] == {"url": object_name}
+        uploaded.append(filepath)
+        return object_name, True
+
+    monkeypatch.setattr(cli_sync, "upload_one", fake_upload_one)
+    monkeypatch.setattr(
+        cli_sync, "presign_one", lambda _s, _t, name, _b: ({"url": name}, 200)
+    )
+    monkeypatch.setattr(cli_sync, "presign_batch", lambda *_args: {})
+    files = [
+        (0, ("/jobs/run/out.h5", "run/out.h5", None, 1)),
+        (1, ("/slurm/run/out.h5", "run/out.h5", None, 1)),
+    ]
+
+    results = cli_sync.upload_many("token", files, workers=2)
+
+    assert results == [("run/out.h5", True), ("run/out.h5", True)]
+    assert sorted(uploaded) == ["/jobs/run/out.h5", "/slurm/run/out.h5"]
+
+
+def test_presign_batch_returns_empty_without_batch_endpoint() -> None:
+    """Servers without the batch route leave every file to per-file presign."""
+
+    class Session:
+        def post(self, *args, **kwargs):
+            return SimpleNamespace(status_code=404)
+
+    assert cli_sync.presign_batch(Session(), "token", [("a", None)]) == {}
+
+
+def test_server_reachable_treats_gateway_errors_as_down(monkeypatch) -> None:
+    """A 5xx from a proxy fails the probe; any other answer means the API is up."""
+    status = {"code": 503}
+    session = SimpleNamespace(
+        head=lambda *args, **kwargs: SimpleNamespace(status_code=status["code"])
+    )
+    monkeypatch.setattr(cli_sync, "api_session", lambda: session)
+
+    assert not cli_sync.server_reachable()
+    status["code"] = 404
+    assert cli_sync.server_reachable()